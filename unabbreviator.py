@@ -10,11 +10,20 @@ import os
 import re
 import subprocess
 import sys
+from bisect import bisect_right
+from collections import defaultdict
+from functools import cache, lru_cache
 from pathlib import Path
 
 import click
 import yaml
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 
 def get_script_dir():
     """Get the directory where this script is located."""
@@ -27,7 +36,7 @@ def load_abbreviations(yaml_path):
         return {}
 
     with open(yaml_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f) or []
+        data = yaml.load(f, Loader=_SafeLoader) or []
 
     # Convert list format to dict for easier lookup
     abbrevs = {}
@@ -50,30 +59,63 @@ def save_abbreviations(yaml_path, abbreviations):
         })
 
     with open(yaml_path, 'w', encoding='utf-8') as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(data, f, Dumper=_SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
 
 def load_ignored_words(ignored_path):
-    """Load ignored words from YAML file."""
-    if not ignored_path.exists():
-        return set()
+    """
+    Load ignored words from a text file with one word per line.
 
-    with open(ignored_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f) or []
+    If the file does not exist yet, fall back to a legacy ignored.yml
+    alongside it so existing ignore lists carry over.
+    """
+    if not ignored_path.exists():
+        legacy_path = ignored_path.with_suffix('.yml')
+        if not legacy_path.exists():
+            return set()
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_SafeLoader) or []
+        return set(word.lower() for word in data)
 
-    return set(word.lower() for word in data)
+    lines = ignored_path.read_text(encoding='utf-8').splitlines()
+    return set(line.strip().lower() for line in lines if line.strip())
 
 
 def save_ignored_words(ignored_path, ignored_words):
-    """Save ignored words to YAML file."""
+    """Save ignored words to a text file, one word per line."""
     data = sorted(ignored_words)
+    ignored_path.write_text(''.join(f'{word}\n' for word in data), encoding='utf-8')
+
+
+def add_ignored_word(ignored_path, ignored_words, word):
+    """
+    Add a word to the ignored set and persist it.
+
+    Appends just the new word when the file already exists, rather than
+    rewriting the whole list on every ignore.
+    """
+    ignored_words.add(word)
+    if not ignored_path.exists():
+        save_ignored_words(ignored_path, ignored_words)
+        return
 
-    with open(ignored_path, 'w', encoding='utf-8') as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+    with open(ignored_path, 'ab+') as f:
+        # Don't join onto a last line that lacks a trailing newline
+        prefix = b''
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                prefix = b'\n'
+        f.write(prefix + word.encode('utf-8') + b'\n')
 
 
 def load_system_dictionary():
-    """Load system dictionary words into a set."""
+    """
+    Load system dictionary words into a set.
+
+    The file is read in a single call and split without decoding, so the
+    set holds lowercase bytes rather than str.
+    """
     dict_paths = [
         '/usr/share/dict/words',  # macOS and most Linux
         '/usr/dict/words',
@@ -82,175 +124,225 @@ def load_system_dictionary():
     words = set()
     for dict_path in dict_paths:
         if os.path.exists(dict_path):
-            with open(dict_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    words.add(line.strip().lower())
+            with open(dict_path, 'rb') as f:
+                words = set(f.read().lower().split())
             break
 
     return words
 
 
+# Common irregular forms mapping to base words
+_IRREGULARS = {
+    'has': 'have', 'had': 'have', 'having': 'have',
+    'is': 'be', 'am': 'be', 'are': 'be', 'was': 'be', 'were': 'be', 'been': 'be', 'being': 'be',
+    'does': 'do', 'did': 'do', 'done': 'do', 'doing': 'do',
+    'goes': 'go', 'went': 'go', 'gone': 'go', 'going': 'go',
+    'says': 'say', 'said': 'say', 'saying': 'say',
+    'makes': 'make', 'made': 'make', 'making': 'make',
+    'takes': 'take', 'took': 'take', 'taken': 'take', 'taking': 'take',
+    'comes': 'come', 'came': 'come', 'coming': 'come',
+    'sees': 'see', 'saw': 'see', 'seen': 'see', 'seeing': 'see',
+    'knows': 'know', 'knew': 'know', 'known': 'know', 'knowing': 'know',
+    'gets': 'get', 'got': 'get', 'gotten': 'get', 'getting': 'get',
+    'gives': 'give', 'gave': 'give', 'given': 'give', 'giving': 'give',
+    'finds': 'find', 'found': 'find', 'finding': 'find',
+    'thinks': 'think', 'thought': 'think', 'thinking': 'think',
+    'tells': 'tell', 'told': 'tell', 'telling': 'tell',
+    'becomes': 'become', 'became': 'become', 'becoming': 'become',
+    'leaves': 'leave', 'left': 'leave', 'leaving': 'leave',
+    'feels': 'feel', 'felt': 'feel', 'feeling': 'feel',
+    'puts': 'put', 'putting': 'put',
+    'brings': 'bring', 'brought': 'bring', 'bringing': 'bring',
+    'begins': 'begin', 'began': 'begin', 'begun': 'begin', 'beginning': 'begin',
+    'keeps': 'keep', 'kept': 'keep', 'keeping': 'keep',
+    'holds': 'hold', 'held': 'hold', 'holding': 'hold',
+    'writes': 'write', 'wrote': 'write', 'written': 'write', 'writing': 'write',
+    'stands': 'stand', 'stood': 'stand', 'standing': 'stand',
+    'hears': 'hear', 'heard': 'hear', 'hearing': 'hear',
+    'lets': 'let', 'letting': 'let',
+    'means': 'mean', 'meant': 'mean', 'meaning': 'mean',
+    'sets': 'set', 'setting': 'set',
+    'meets': 'meet', 'met': 'meet', 'meeting': 'meet',
+    'runs': 'run', 'ran': 'run', 'running': 'run',
+    'pays': 'pay', 'paid': 'pay', 'paying': 'pay',
+    'sits': 'sit', 'sat': 'sit', 'sitting': 'sit',
+    'speaks': 'speak', 'spoke': 'speak', 'spoken': 'speak', 'speaking': 'speak',
+    'lies': 'lie', 'lay': 'lie', 'lain': 'lie', 'lying': 'lie',
+    'leads': 'lead', 'led': 'lead', 'leading': 'lead',
+    'reads': 'read', 'reading': 'read',
+    'grows': 'grow', 'grew': 'grow', 'grown': 'grow', 'growing': 'grow',
+    'loses': 'lose', 'lost': 'lose', 'losing': 'lose',
+    'falls': 'fall', 'fell': 'fall', 'fallen': 'fall', 'falling': 'fall',
+    'sends': 'send', 'sent': 'send', 'sending': 'send',
+    'builds': 'build', 'built': 'build', 'building': 'build',
+    'understands': 'understand', 'understood': 'understand', 'understanding': 'understand',
+    'draws': 'draw', 'drew': 'draw', 'drawn': 'draw', 'drawing': 'draw',
+    'breaks': 'break', 'broke': 'break', 'broken': 'break', 'breaking': 'break',
+    'spends': 'spend', 'spent': 'spend', 'spending': 'spend',
+    'cuts': 'cut', 'cutting': 'cut',
+    'catches': 'catch', 'caught': 'catch', 'catching': 'catch',
+    'chooses': 'choose', 'chose': 'choose', 'chosen': 'choose', 'choosing': 'choose',
+    'wears': 'wear', 'wore': 'wear', 'worn': 'wear', 'wearing': 'wear',
+    'eats': 'eat', 'ate': 'eat', 'eaten': 'eat', 'eating': 'eat',
+    'drives': 'drive', 'drove': 'drive', 'driven': 'drive', 'driving': 'drive',
+    'rises': 'rise', 'rose': 'rise', 'risen': 'rise', 'rising': 'rise',
+    'wins': 'win', 'won': 'win', 'winning': 'win',
+    'throws': 'throw', 'threw': 'throw', 'thrown': 'throw', 'throwing': 'throw',
+    'flies': 'fly', 'flew': 'fly', 'flown': 'fly', 'flying': 'fly',
+    'hits': 'hit', 'hitting': 'hit',
+    'buys': 'buy', 'bought': 'buy', 'buying': 'buy',
+    'teaches': 'teach', 'taught': 'teach', 'teaching': 'teach',
+    'sells': 'sell', 'sold': 'sell', 'selling': 'sell',
+    'fights': 'fight', 'fought': 'fight', 'fighting': 'fight',
+    'sleeps': 'sleep', 'slept': 'sleep', 'sleeping': 'sleep',
+    'costs': 'cost', 'costing': 'cost',
+    'shuts': 'shut', 'shutting': 'shut',
+    'forgets': 'forget', 'forgot': 'forget', 'forgotten': 'forget', 'forgetting': 'forget',
+}
+
+# Common suffix patterns and their replacements
+_SUFFIX_RULES = (
+    # Plurals and verb forms
+    ('ies', 'y'),      # policies -> policy
+    ('ies', 'ie'),     # cookies -> cookie
+    ('es', ''),        # changes -> chang, boxes -> box
+    ('es', 'e'),       # changes -> change
+    ('s', ''),         # notes -> note
+    # Past tense and -ing
+    ('ied', 'y'),      # tried -> try
+    ('ed', ''),        # changed -> chang
+    ('ed', 'e'),       # changed -> change
+    ('ing', ''),       # working -> work
+    ('ing', 'e'),      # making -> make
+    # Doubling consonant
+    ('ning', 'n'),     # running -> run
+    ('ting', 't'),     # hitting -> hit
+    ('ping', 'p'),     # stopping -> stop
+    ('bing', 'b'),     # grabbing -> grab
+    ('ding', 'd'),     # adding -> add
+    ('ging', 'g'),     # hugging -> hug
+    ('ming', 'm'),     # swimming -> swim
+    # -er, -est
+    ('ier', 'y'),      # happier -> happy
+    ('iest', 'y'),     # happiest -> happy
+    ('er', ''),        # worker -> work
+    ('er', 'e'),       # larger -> large
+    ('est', ''),       # largest -> larg
+    ('est', 'e'),      # largest -> large
+    # -ly
+    ('ly', ''),        # quickly -> quick
+    ('ily', 'y'),      # happily -> happy
+    # -tion, -ness, etc.
+    ('tion', 't'),     # creation -> creat (partial)
+    ('ness', ''),      # happiness -> happi (partial)
+    ('ment', ''),      # government -> govern
+    ('able', ''),      # workable -> work
+    ('able', 'e'),     # lovable -> love
+    ('ible', ''),      # possible -> poss (partial)
+)
+
+
+def _index_suffix_rules(rules):
+    """Group (suffix, replacement) rules into a dict keyed by suffix."""
+    index = {}
+    for suffix, replacement in rules:
+        index.setdefault(suffix, []).append(replacement)
+    return {suffix: tuple(replacements) for suffix, replacements in index.items()}
+
+
+# Suffix rules keyed by suffix, so a word only tries the suffixes it ends with
+_REPLACEMENTS_BY_SUFFIX = _index_suffix_rules(_SUFFIX_RULES)
+_SUFFIX_LENGTHS = tuple(sorted({len(suffix) for suffix in _REPLACEMENTS_BY_SUFFIX}))
+
+
+@lru_cache(maxsize=65536)
 def get_word_variants(word):
-    """Generate possible base forms of a word by stripping common suffixes."""
+    """Generate possible base forms of a word by stripping common suffixes.
+
+    Results are cached per word, so callers get back an immutable tuple.
+    """
     word = word.lower()
     variants = [word]
 
-    # Common irregular forms mapping to base words
-    irregulars = {
-        'has': 'have', 'had': 'have', 'having': 'have',
-        'is': 'be', 'am': 'be', 'are': 'be', 'was': 'be', 'were': 'be', 'been': 'be', 'being': 'be',
-        'does': 'do', 'did': 'do', 'done': 'do', 'doing': 'do',
-        'goes': 'go', 'went': 'go', 'gone': 'go', 'going': 'go',
-        'says': 'say', 'said': 'say', 'saying': 'say',
-        'makes': 'make', 'made': 'make', 'making': 'make',
-        'takes': 'take', 'took': 'take', 'taken': 'take', 'taking': 'take',
-        'comes': 'come', 'came': 'come', 'coming': 'come',
-        'sees': 'see', 'saw': 'see', 'seen': 'see', 'seeing': 'see',
-        'knows': 'know', 'knew': 'know', 'known': 'know', 'knowing': 'know',
-        'gets': 'get', 'got': 'get', 'gotten': 'get', 'getting': 'get',
-        'gives': 'give', 'gave': 'give', 'given': 'give', 'giving': 'give',
-        'finds': 'find', 'found': 'find', 'finding': 'find',
-        'thinks': 'think', 'thought': 'think', 'thinking': 'think',
-        'tells': 'tell', 'told': 'tell', 'telling': 'tell',
-        'becomes': 'become', 'became': 'become', 'becoming': 'become',
-        'leaves': 'leave', 'left': 'leave', 'leaving': 'leave',
-        'feels': 'feel', 'felt': 'feel', 'feeling': 'feel',
-        'puts': 'put', 'putting': 'put',
-        'brings': 'bring', 'brought': 'bring', 'bringing': 'bring',
-        'begins': 'begin', 'began': 'begin', 'begun': 'begin', 'beginning': 'begin',
-        'keeps': 'keep', 'kept': 'keep', 'keeping': 'keep',
-        'holds': 'hold', 'held': 'hold', 'holding': 'hold',
-        'writes': 'write', 'wrote': 'write', 'written': 'write', 'writing': 'write',
-        'stands': 'stand', 'stood': 'stand', 'standing': 'stand',
-        'hears': 'hear', 'heard': 'hear', 'hearing': 'hear',
-        'lets': 'let', 'letting': 'let',
-        'means': 'mean', 'meant': 'mean', 'meaning': 'mean',
-        'sets': 'set', 'setting': 'set',
-        'meets': 'meet', 'met': 'meet', 'meeting': 'meet',
-        'runs': 'run', 'ran': 'run', 'running': 'run',
-        'pays': 'pay', 'paid': 'pay', 'paying': 'pay',
-        'sits': 'sit', 'sat': 'sit', 'sitting': 'sit',
-        'speaks': 'speak', 'spoke': 'speak', 'spoken': 'speak', 'speaking': 'speak',
-        'lies': 'lie', 'lay': 'lie', 'lain': 'lie', 'lying': 'lie',
-        'leads': 'lead', 'led': 'lead', 'leading': 'lead',
-        'reads': 'read', 'reading': 'read',
-        'grows': 'grow', 'grew': 'grow', 'grown': 'grow', 'growing': 'grow',
-        'loses': 'lose', 'lost': 'lose', 'losing': 'lose',
-        'falls': 'fall', 'fell': 'fall', 'fallen': 'fall', 'falling': 'fall',
-        'sends': 'send', 'sent': 'send', 'sending': 'send',
-        'builds': 'build', 'built': 'build', 'building': 'build',
-        'understands': 'understand', 'understood': 'understand', 'understanding': 'understand',
-        'draws': 'draw', 'drew': 'draw', 'drawn': 'draw', 'drawing': 'draw',
-        'breaks': 'break', 'broke': 'break', 'broken': 'break', 'breaking': 'break',
-        'spends': 'spend', 'spent': 'spend', 'spending': 'spend',
-        'cuts': 'cut', 'cutting': 'cut',
-        'catches': 'catch', 'caught': 'catch', 'catching': 'catch',
-        'chooses': 'choose', 'chose': 'choose', 'chosen': 'choose', 'choosing': 'choose',
-        'wears': 'wear', 'wore': 'wear', 'worn': 'wear', 'wearing': 'wear',
-        'eats': 'eat', 'ate': 'eat', 'eaten': 'eat', 'eating': 'eat',
-        'drives': 'drive', 'drove': 'drive', 'driven': 'drive', 'driving': 'drive',
-        'rises': 'rise', 'rose': 'rise', 'risen': 'rise', 'rising': 'rise',
-        'wins': 'win', 'won': 'win', 'winning': 'win',
-        'throws': 'throw', 'threw': 'throw', 'thrown': 'throw', 'throwing': 'throw',
-        'flies': 'fly', 'flew': 'fly', 'flown': 'fly', 'flying': 'fly',
-        'hits': 'hit', 'hitting': 'hit',
-        'buys': 'buy', 'bought': 'buy', 'buying': 'buy',
-        'teaches': 'teach', 'taught': 'teach', 'teaching': 'teach',
-        'sells': 'sell', 'sold': 'sell', 'selling': 'sell',
-        'fights': 'fight', 'fought': 'fight', 'fighting': 'fight',
-        'sleeps': 'sleep', 'slept': 'sleep', 'sleeping': 'sleep',
-        'costs': 'cost', 'costing': 'cost',
-        'shuts': 'shut', 'shutting': 'shut',
-        'forgets': 'forget', 'forgot': 'forget', 'forgotten': 'forget', 'forgetting': 'forget',
-    }
+    if word in _IRREGULARS:
+        variants.append(_IRREGULARS[word])
 
-    if word in irregulars:
-        variants.append(irregulars[word])
-
-    # Common suffix patterns and their replacements
-    suffix_rules = [
-        # Plurals and verb forms
-        ('ies', 'y'),      # policies -> policy
-        ('ies', 'ie'),     # cookies -> cookie
-        ('es', ''),        # changes -> chang, boxes -> box
-        ('es', 'e'),       # changes -> change
-        ('s', ''),         # notes -> note
-        # Past tense and -ing
-        ('ied', 'y'),      # tried -> try
-        ('ed', ''),        # changed -> chang
-        ('ed', 'e'),       # changed -> change
-        ('ing', ''),       # working -> work
-        ('ing', 'e'),      # making -> make
-        # Doubling consonant
-        ('ning', 'n'),     # running -> run
-        ('ting', 't'),     # hitting -> hit
-        ('ping', 'p'),     # stopping -> stop
-        ('bing', 'b'),     # grabbing -> grab
-        ('ding', 'd'),     # adding -> add
-        ('ging', 'g'),     # hugging -> hug
-        ('ming', 'm'),     # swimming -> swim
-        # -er, -est
-        ('ier', 'y'),      # happier -> happy
-        ('iest', 'y'),     # happiest -> happy
-        ('er', ''),        # worker -> work
-        ('er', 'e'),       # larger -> large
-        ('est', ''),       # largest -> larg
-        ('est', 'e'),      # largest -> large
-        # -ly
-        ('ly', ''),        # quickly -> quick
-        ('ily', 'y'),      # happily -> happy
-        # -tion, -ness, etc.
-        ('tion', 't'),     # creation -> creat (partial)
-        ('ness', ''),      # happiness -> happi (partial)
-        ('ment', ''),      # government -> govern
-        ('able', ''),      # workable -> work
-        ('able', 'e'),     # lovable -> love
-        ('ible', ''),      # possible -> poss (partial)
-    ]
+    for suffix_len in _SUFFIX_LENGTHS:
+        if suffix_len > len(word):
+            break
+        replacements = _REPLACEMENTS_BY_SUFFIX.get(word[-suffix_len:])
+        if replacements:
+            stem = word[:-suffix_len]
+            for replacement in replacements:
+                base = stem + replacement
+                if len(base) >= 2:  # Don't create too-short words
+                    variants.append(base)
+
+    return tuple(variants)
 
-    for suffix, replacement in suffix_rules:
-        if word.endswith(suffix):
-            base = word[:-len(suffix)] + replacement
-            if len(base) >= 2:  # Don't create too-short words
-                variants.append(base)
 
-    return variants
+@lru_cache(maxsize=65536)
+def _dictionary_keys(word):
+    """Encode a lowercase word's variants once, to match the bytes dictionary."""
+    return tuple(v.encode('utf-8') for v in get_word_variants(word))
 
 
 def is_in_dictionary(word, dictionary):
-    """Check if a word or any of its base forms is in the system dictionary."""
-    variants = get_word_variants(word)
-    return any(v in dictionary for v in variants)
+    """
+    Check if a word or any of its base forms is in the system dictionary.
+
+    The dictionary holds lowercase bytes (see load_system_dictionary), so
+    the variants are looked up in their cached encoded form.
+    """
+    word = word.lower()
+    # Most words are base forms already, so try the word itself first
+    if word.encode('utf-8') in dictionary:
+        return True
+    return any(key in dictionary for key in _dictionary_keys(word))
+
+
+# Match words (including contractions and hyphenated words)
+_WORD_RE = re.compile(r"\b[a-zA-Z]+(?:[''-][a-zA-Z]+)*\b")
 
 
 def extract_words(text):
-    """Extract words and their positions from text."""
-    # Match words (including contractions and hyphenated words)
-    pattern = r"\b[a-zA-Z]+(?:[''-][a-zA-Z]+)*\b"
+    """
+    Extract words and their positions from text.
 
+    Returns three parallel lists: words, start offsets and end offsets.
+    """
     words = []
-    for match in re.finditer(pattern, text):
-        words.append({
-            'word': match.group(),
-            'start': match.start(),
-            'end': match.end()
-        })
-    return words
+    starts = []
+    ends = []
+    for match in _WORD_RE.finditer(text):
+        words.append(match.group())
+        starts.append(match.start())
+        ends.append(match.end())
+    return words, starts, ends
 
 
-def get_context(text, start, end, context_lines=1):
-    """Get the context around a word position."""
+def build_line_index(text):
+    """Split text into lines and record the character offset of each line start."""
     lines = text.split('\n')
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)  # +1 for newline
+    return lines, line_starts
+
+
+def get_context(text, start, end, context_lines=1, line_index=None):
+    """
+    Get the context around a word position.
+
+    Pass a line_index from build_line_index() to avoid re-splitting the text
+    on every call.
+    """
+    if line_index is None:
+        line_index = build_line_index(text)
+    lines, line_starts = line_index
 
     # Find which line contains the word
-    char_count = 0
-    target_line_idx = 0
-    for i, line in enumerate(lines):
-        line_end = char_count + len(line)
-        if char_count <= start <= line_end:
-            target_line_idx = i
-            break
-        char_count = line_end + 1  # +1 for newline
+    target_line_idx = bisect_right(line_starts, start) - 1
 
     # Get surrounding lines
     start_idx = max(0, target_line_idx - context_lines)
@@ -270,6 +362,26 @@ def apply_case(original, replacement):
         return replacement.lower()
 
 
+def apply_replacements(text, replacements):
+    """
+    Apply a list of (start, end, replacement) tuples to text.
+
+    The output is assembled from slices in a single pass, rather than
+    rebuilding the whole string once per replacement.
+    """
+    if not replacements:
+        return text
+
+    parts = []
+    pos = 0
+    for start, end, replacement in sorted(replacements, key=lambda x: x[0]):
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
 def format_progress_bar(current, total, width=30):
     """Format a text-based progress bar."""
     if total == 0:
@@ -282,6 +394,43 @@ def format_progress_bar(current, total, width=30):
     return f"[{bar}] {current}/{total} words ({percent}%)"
 
 
+@lru_cache(maxsize=256)
+def _whole_word_pattern(word):
+    """Compile a pattern matching word only where it stands as a whole word."""
+    return re.compile(rf'\b{re.escape(word)}\b')
+
+
+# Fixed pieces of the prompt, styled once rather than on every prompt
+_DIVIDER = click.style('─' * 60, fg='blue')
+_CONTEXT_HEADER = click.style('Context:', fg='cyan', bold=True)
+_FOUND_ABBREV_LABEL = click.style('Found abbreviation: ', fg='cyan')
+_UNKNOWN_WORD_LABEL = click.style('Unknown word: ', fg='cyan')
+_EXPANSIONS_HEADER = click.style('Expansions:', fg='green', bold=True)
+_NEW_EXPANSION_OPTION = click.style("  [n] New expansion...", fg='green')
+_ADD_EXPANSION_OPTION = click.style("  [e] Add expansion...", fg='green', bold=True)
+_ACTIONS_MENU = '\n'.join([
+    click.style('Actions:', dim=True),
+    click.style("  [s] Skip    [i] Ignore    [o] Once...", dim=True),
+    click.style("  [v] Save & stop    [a] Abort", dim=True),
+])
+_EMPTY_EXPANSION_ERROR = click.style('Empty expansion not allowed.', fg='red')
+_INVALID_CHOICE_ERROR = click.style('Invalid choice.', fg='red')
+
+
+def _expansion_result(action, expansion=None, add_to_yaml=False):
+    """Build the result dict returned by prompt_for_expansion."""
+    return {'action': action, 'expansion': expansion, 'add_to_yaml': add_to_yaml}
+
+
+def _prompt_for_term(text, action, add_to_yaml):
+    """Ask for an expansion; returns None (after a warning) if it is empty."""
+    new_term = click.prompt(text).strip()
+    if new_term:
+        return _expansion_result(action, new_term, add_to_yaml)
+    click.echo(_EMPTY_EXPANSION_ERROR)
+    return None
+
+
 def prompt_for_expansion(word, context, terms, is_known_abbrev, current_word=0, total_words=0):
     """
     Prompt user to choose an expansion for a word.
@@ -292,133 +441,106 @@ def prompt_for_expansion(word, context, terms, is_known_abbrev, current_word=0,
         - add_to_yaml: whether to add to YAML
     """
     click.echo()
-    click.echo(click.style('─' * 60, fg='blue'))
+    click.echo(_DIVIDER)
 
     # Show progress bar
     if total_words > 0:
         progress = format_progress_bar(current_word, total_words)
         click.echo(click.style(progress, fg='magenta'))
 
-    click.echo(click.style('Context:', fg='cyan', bold=True))
+    click.echo(_CONTEXT_HEADER)
 
-    # Highlight the word in context
-    highlighted = context.replace(word, click.style(word, fg='yellow', bold=True))
+    # Highlight the word in context (whole-word matches only)
+    styled_word = click.style(word, fg='yellow', bold=True)
+    highlighted = _whole_word_pattern(word).sub(lambda m: styled_word, context)
     click.echo(f"  {highlighted}")
     click.echo()
 
+    # Expansion options - highlighted in green
     if is_known_abbrev:
-        click.echo(click.style(f'Found abbreviation: ', fg='cyan') +
-                   click.style(word, fg='yellow', bold=True))
-
-        # Expansion options - highlighted in green
-        click.echo(click.style('Expansions:', fg='green', bold=True))
+        click.echo(_FOUND_ABBREV_LABEL + styled_word)
+        click.echo(_EXPANSIONS_HEADER)
         for i, term in enumerate(terms, 1):
             click.echo(click.style(f"  [{i}] {term}", fg='green', bold=True))
-        click.echo(click.style(f"  [n] New expansion...", fg='green'))
-
-        # Action options - dimmer
-        click.echo(click.style('Actions:', dim=True))
-        click.echo(click.style("  [s] Skip    [i] Ignore    [o] Once...", dim=True))
-        click.echo(click.style("  [v] Save & stop    [a] Abort", dim=True))
-
-        while True:
-            choice = click.prompt('Choose', default='s').strip().lower()
-
-            if choice == 's':
-                return {'action': 'skip', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'i':
-                return {'action': 'ignore', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'v':
-                return {'action': 'save', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'a':
-                return {'action': 'abort', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'o':
-                new_term = click.prompt('Enter expansion (one-time)').strip()
-                if new_term:
-                    return {'action': 'once', 'expansion': new_term, 'add_to_yaml': False}
-                click.echo(click.style('Empty expansion not allowed.', fg='red'))
-            elif choice == 'n':
-                new_term = click.prompt('Enter new expansion').strip()
-                if new_term:
-                    return {'action': 'expand', 'expansion': new_term, 'add_to_yaml': True}
-                click.echo(click.style('Empty expansion not allowed.', fg='red'))
-            elif choice.isdigit():
-                idx = int(choice) - 1
-                if 0 <= idx < len(terms):
-                    return {'action': 'expand', 'expansion': terms[idx], 'add_to_yaml': False}
-                click.echo(click.style('Invalid choice.', fg='red'))
-            else:
-                click.echo(click.style('Invalid choice.', fg='red'))
+        click.echo(_NEW_EXPANSION_OPTION)
+    else:
+        click.echo(_UNKNOWN_WORD_LABEL + styled_word)
+        click.echo(_EXPANSIONS_HEADER)
+        click.echo(_ADD_EXPANSION_OPTION)
+
+    # Action options - dimmer
+    click.echo(_ACTIONS_MENU)
+
+    # Choice -> handler returning a result dict, or None to ask again
+    handlers = {
+        's': lambda: _expansion_result('skip'),
+        'i': lambda: _expansion_result('ignore'),
+        'v': lambda: _expansion_result('save'),
+        'a': lambda: _expansion_result('abort'),
+        'o': lambda: _prompt_for_term('Enter expansion (one-time)', 'once', add_to_yaml=False),
+    }
+    if is_known_abbrev:
+        handlers['n'] = lambda: _prompt_for_term('Enter new expansion', 'expand', add_to_yaml=True)
     else:
-        click.echo(click.style(f'Unknown word: ', fg='cyan') +
-                   click.style(word, fg='yellow', bold=True))
-
-        # Expansion options - highlighted in green
-        click.echo(click.style('Expansions:', fg='green', bold=True))
-        click.echo(click.style(f"  [e] Add expansion...", fg='green', bold=True))
-
-        # Action options - dimmer
-        click.echo(click.style('Actions:', dim=True))
-        click.echo(click.style("  [s] Skip    [i] Ignore    [o] Once...", dim=True))
-        click.echo(click.style("  [v] Save & stop    [a] Abort", dim=True))
-
-        while True:
-            choice = click.prompt('Choose', default='s').strip().lower()
-
-            if choice == 's':
-                return {'action': 'skip', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'i':
-                return {'action': 'ignore', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'v':
-                return {'action': 'save', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'a':
-                return {'action': 'abort', 'expansion': None, 'add_to_yaml': False}
-            elif choice == 'o':
-                new_term = click.prompt('Enter expansion (one-time)').strip()
-                if new_term:
-                    return {'action': 'once', 'expansion': new_term, 'add_to_yaml': False}
-                click.echo(click.style('Empty expansion not allowed.', fg='red'))
-            elif choice == 'e':
-                new_term = click.prompt('Enter expansion').strip()
-                if new_term:
-                    return {'action': 'expand', 'expansion': new_term, 'add_to_yaml': True}
-                click.echo(click.style('Empty expansion not allowed.', fg='red'))
-            else:
-                click.echo(click.style('Invalid choice.', fg='red'))
-
-
-def process_document(text, abbreviations, dictionary, yaml_path, ignored_words, ignored_path):
+        handlers['e'] = lambda: _prompt_for_term('Enter expansion', 'expand', add_to_yaml=True)
+
+    while True:
+        choice = click.prompt('Choose', default='s').strip().lower()
+
+        handler = handlers.get(choice)
+        if handler:
+            result = handler()
+            if result:
+                return result
+        elif is_known_abbrev and choice.isdecimal() and 0 < int(choice) <= len(terms):
+            return _expansion_result('expand', terms[int(choice) - 1])
+        else:
+            click.echo(_INVALID_CHOICE_ERROR)
+
+
+def process_document(text, abbreviations, get_dictionary, yaml_path, ignored_words, ignored_path):
     """
     Process a document, prompting for abbreviation expansions.
 
+    get_dictionary is a callable returning the system dictionary; it is only
+    called once a word actually needs a dictionary check.
+
     Returns:
         - text: the processed text
         - modified: whether any changes were made
         - aborted: whether user chose to abort (discard changes)
     """
-    words = extract_words(text)
+    words, starts, ends = extract_words(text)
+    words_lower = [w.lower() for w in words]
     total_words = len(words)
-    replacements = []  # List of (start, end, replacement)
-    modified = False
 
-    # Track words we've already prompted about (to avoid asking twice for same word)
-    prompted_words = set()
+    # Index token positions by lowercase form. Keys keep the order of first
+    # appearance, so each distinct word is visited once, in document order.
+    positions_by_lower = defaultdict(list)
+    for i, wl in enumerate(words_lower):
+        positions_by_lower[wl].append(i)
 
-    for word_index, word_info in enumerate(words):
-        word = word_info['word']
-        word_lower = word.lower()
+    line_index = build_line_index(text)
+    replacements = []  # List of (start, end, replacement)
+    modified = False
 
-        # Skip if we've already prompted about this word form or it's ignored
-        if word_lower in prompted_words or word_lower in ignored_words:
+    for word_lower, positions in positions_by_lower.items():
+        # Skip words the user has chosen to ignore
+        if word_lower in ignored_words:
             continue
 
+        # Prompt at the first occurrence of this word form
+        word_index = positions[0]
+        word = words[word_index]
+
         is_known_abbrev = word_lower in abbreviations
-        in_dict = is_in_dictionary(word, dictionary)
+        if not is_known_abbrev and is_in_dictionary(word_lower, get_dictionary()):
+            continue
 
         if is_known_abbrev:
             # Known abbreviation - prompt user
             terms = abbreviations[word_lower]
-            context, _ = get_context(text, word_info['start'], word_info['end'])
+            context, _ = get_context(text, starts[word_index], ends[word_index], line_index=line_index)
 
             result = prompt_for_expansion(word, context, terms, True, word_index + 1, total_words)
             action = result['action']
@@ -430,25 +552,18 @@ def process_document(text, abbreviations, dictionary, yaml_path, ignored_words,
             if action == 'save':
                 click.echo(click.style('Saving and stopping...', fg='yellow'))
                 # Apply current replacements and return
-                if replacements:
-                    replacements.sort(key=lambda x: x[0], reverse=True)
-                    for start, end, replacement in replacements:
-                        text = text[:start] + replacement + text[end:]
-                return text, modified, False
+                return apply_replacements(text, replacements), modified, False
 
             if action == 'ignore':
-                ignored_words.add(word_lower)
-                save_ignored_words(ignored_path, ignored_words)
+                add_ignored_word(ignored_path, ignored_words, word_lower)
                 click.echo(click.style(f'Added "{word_lower}" to ignored words.', fg='green'))
-                prompted_words.add(word_lower)
                 continue
 
             if action in ('expand', 'once') and result['expansion']:
                 expansion = result['expansion']
                 # Find all occurrences of this word and queue for replacement
-                for w in words:
-                    if w['word'].lower() == word_lower:
-                        replacements.append((w['start'], w['end'], apply_case(w['word'], expansion)))
+                for i in positions:
+                    replacements.append((starts[i], ends[i], apply_case(words[i], expansion)))
 
                 # Add new term to abbreviations only if not 'once'
                 if result['add_to_yaml'] and expansion not in abbreviations[word_lower]:
@@ -458,11 +573,9 @@ def process_document(text, abbreviations, dictionary, yaml_path, ignored_words,
 
                 modified = True
 
-            prompted_words.add(word_lower)
-
-        elif not in_dict:
+        else:
             # Unknown word not in dictionary - prompt user
-            context, _ = get_context(text, word_info['start'], word_info['end'])
+            context, _ = get_context(text, starts[word_index], ends[word_index], line_index=line_index)
 
             result = prompt_for_expansion(word, context, [], False, word_index + 1, total_words)
             action = result['action']
@@ -474,25 +587,18 @@ def process_document(text, abbreviations, dictionary, yaml_path, ignored_words,
             if action == 'save':
                 click.echo(click.style('Saving and stopping...', fg='yellow'))
                 # Apply current replacements and return
-                if replacements:
-                    replacements.sort(key=lambda x: x[0], reverse=True)
-                    for start, end, replacement in replacements:
-                        text = text[:start] + replacement + text[end:]
-                return text, modified, False
+                return apply_replacements(text, replacements), modified, False
 
             if action == 'ignore':
-                ignored_words.add(word_lower)
-                save_ignored_words(ignored_path, ignored_words)
+                add_ignored_word(ignored_path, ignored_words, word_lower)
                 click.echo(click.style(f'Added "{word_lower}" to ignored words.', fg='green'))
-                prompted_words.add(word_lower)
                 continue
 
             if action in ('expand', 'once') and result['expansion']:
                 expansion = result['expansion']
                 # Find all occurrences of this word and queue for replacement
-                for w in words:
-                    if w['word'].lower() == word_lower:
-                        replacements.append((w['start'], w['end'], apply_case(w['word'], expansion)))
+                for i in positions:
+                    replacements.append((starts[i], ends[i], apply_case(words[i], expansion)))
 
                 # Add new abbreviation only if not 'once'
                 if result['add_to_yaml']:
@@ -502,63 +608,118 @@ def process_document(text, abbreviations, dictionary, yaml_path, ignored_words,
 
                 modified = True
 
-            prompted_words.add(word_lower)
+    return apply_replacements(text, replacements), modified, False
 
-    # Apply replacements in reverse order to preserve positions
-    if replacements:
-        # Sort by position descending
-        replacements.sort(key=lambda x: x[0], reverse=True)
-        for start, end, replacement in replacements:
-            text = text[:start] + replacement + text[end:]
 
-    return text, modified, False
+def expand_known_abbreviations(text, abbreviations, ignored_words):
+    """
+    Expand abbreviations non-interactively in a single regex pass.
 
+    Only abbreviations with exactly one expansion are applied; ambiguous
+    ones and ignored words are left as-is. Matches follow the same word
+    boundaries as extract_words, so e.g. "govt" is not expanded inside
+    "govt-led".
 
-def get_frontmost_document_macos():
-    """Get the path of the frontmost document on macOS using AppleScript."""
-    script = '''
-    tell application "System Events"
-        set frontApp to name of first application process whose frontmost is true
+    Returns:
+        - text: the processed text
+        - count: the number of replacements made
+    """
+    brevs = [
+        brev for brev, terms in abbreviations.items()
+        if len(terms) == 1 and brev not in ignored_words and _WORD_RE.fullmatch(brev)
+    ]
+    if not brevs:
+        return text, 0
+
+    # Longest first, so a shorter abbreviation never shadows a longer one
+    alternation = '|'.join(re.escape(brev) for brev in sorted(brevs, key=len, reverse=True))
+    pattern = re.compile(rf"(?<![a-zA-Z]['-])\b(?:{alternation})\b(?!['-][a-zA-Z])", re.IGNORECASE)
+
+    def expand(match):
+        word = match.group()
+        terms = abbreviations.get(word.lower())
+        if not terms:
+            return word
+        return apply_case(word, terms[0])
+
+    return pattern.subn(expand, text)
+
+
+# AppleScript returning the file path of the frontmost app's document
+_FRONTMOST_DOCUMENT_SCRIPT = '''
+tell application "System Events"
+    set frontApp to name of first application process whose frontmost is true
+end tell
+
+if frontApp is "TextEdit" then
+    tell application "TextEdit"
+        if (count of documents) > 0 then
+            set docPath to path of document 1
+            return docPath
+        end if
     end tell
-
-    if frontApp is "TextEdit" then
-        tell application "TextEdit"
-            if (count of documents) > 0 then
-                set docPath to path of document 1
-                return docPath
-            end if
-        end tell
-    else if frontApp is "Typora" then
-        tell application "Typora"
+else if frontApp is "Typora" then
+    tell application "Typora"
+        if (count of documents) > 0 then
+            return path of document 1
+        end if
+    end tell
+else
+    -- Try generic approach for document-based apps
+    tell application frontApp
+        try
             if (count of documents) > 0 then
                 return path of document 1
             end if
-        end tell
-    else
-        -- Try generic approach for document-based apps
-        tell application frontApp
-            try
-                if (count of documents) > 0 then
-                    return path of document 1
-                end if
-            end try
-        end tell
-    end if
-    return ""
-    '''
+        end try
+    end tell
+end if
+return ""
+'''
 
+
+@cache
+def _compiled_frontmost_document_script():
+    """
+    Compile the frontmost-document AppleScript in-process via PyObjC.
+
+    Returns None when PyObjC is not installed.
+    """
     try:
-        result = subprocess.run(
-            ['osascript', '-e', script],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        path = result.stdout.strip()
-        if path and os.path.exists(path):
-            return path
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-        pass
+        from Foundation import NSAppleScript
+    except ImportError:
+        return None
+    return NSAppleScript.alloc().initWithSource_(_FRONTMOST_DOCUMENT_SCRIPT)
+
+
+def get_frontmost_document_macos():
+    """
+    Get the path of the frontmost document on macOS using AppleScript.
+
+    Runs the script in-process through PyObjC when available, avoiding an
+    osascript launch on every call; falls back to osascript otherwise.
+    """
+    path = None
+    script = _compiled_frontmost_document_script()
+    if script is not None:
+        result, error = script.executeAndReturnError_(None)
+        if error is None and result is not None:
+            path = (result.stringValue() or '').strip()
+
+    if path is None:
+        try:
+            result = subprocess.run(
+                ['osascript', '-e', _FRONTMOST_DOCUMENT_SCRIPT],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            path = result.stdout.strip()
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            pass
+
+    if path and os.path.exists(path):
+        return path
 
     return None
 
@@ -570,13 +731,16 @@ def get_frontmost_document_macos():
 @click.option('--abbreviations', '-a', type=click.Path(),
               help='Path to abbreviations YAML file (default: abbreviations.yml in script directory)')
 @click.option('--dry-run', '-n', is_flag=True, help='Show changes without modifying the file')
-def main(file, output, gui, abbreviations, dry_run):
+@click.option('--batch', '-b', is_flag=True,
+              help='Expand abbreviations with a single expansion without prompting')
+def main(file, output, gui, abbreviations, dry_run, batch):
     """
     Expand abbreviations in a text or markdown document.
 
     If FILE is provided, process that file. Optionally specify OUTPUT to write
     to a different file (preserving the original). With --gui, process the
-    frontmost document in a supported macOS application.
+    frontmost document in a supported macOS application. With --batch, expand
+    every abbreviation that has exactly one expansion without prompting.
 
     Examples:
 
@@ -587,6 +751,8 @@ def main(file, output, gui, abbreviations, dry_run):
         unabbreviator --gui
 
         unabbreviator -a ~/my-abbreviations.yml document.md
+
+        unabbreviator --batch notes.txt
     """
     # Determine file to process
     if gui:
@@ -615,7 +781,7 @@ def main(file, output, gui, abbreviations, dry_run):
         raise click.ClickException(f'Abbreviations file not found: {yaml_path}')
 
     # Ignored words file is alongside abbreviations file
-    ignored_path = yaml_path.parent / 'ignored.yml'
+    ignored_path = yaml_path.parent / 'ignored.txt'
 
     click.echo(click.style(f'Processing: {file_path}', fg='cyan'))
     click.echo(click.style(f'Using abbreviations: {yaml_path}', fg='cyan'))
@@ -624,18 +790,24 @@ def main(file, output, gui, abbreviations, dry_run):
     # Load data
     abbrevs = load_abbreviations(yaml_path)
     ignored_words = load_ignored_words(ignored_path)
-    dictionary = load_system_dictionary()
+    # The system dictionary is loaded on first use, if any word needs it
+    get_dictionary = cache(load_system_dictionary)
 
-    click.echo(f'Loaded {len(abbrevs)} abbreviations, {len(ignored_words)} ignored words, {len(dictionary)} dictionary words')
+    click.echo(f'Loaded {len(abbrevs)} abbreviations, {len(ignored_words)} ignored words')
 
     # Read document
     with open(file_path, 'r', encoding='utf-8') as f:
         original_text = f.read()
 
     # Process document
-    processed_text, modified, aborted = process_document(
-        original_text, abbrevs, dictionary, yaml_path, ignored_words, ignored_path
-    )
+    if batch:
+        processed_text, count = expand_known_abbreviations(original_text, abbrevs, ignored_words)
+        click.echo(f'Expanded {count} abbreviations')
+        modified, aborted = count > 0, False
+    else:
+        processed_text, modified, aborted = process_document(
+            original_text, abbrevs, get_dictionary, yaml_path, ignored_words, ignored_path
+        )
 
     if aborted:
         # User chose to abort - don't save anything
@@ -655,7 +827,7 @@ def main(file, output, gui, abbreviations, dry_run):
     # Write or display results
     if dry_run:
         click.echo()
-        click.echo(click.style('─' * 60, fg='blue'))
+        click.echo(_DIVIDER)
         click.echo(click.style('Dry run - changes not saved:', fg='yellow', bold=True))
         click.echo(processed_text)
     else: